@@ -11,14 +11,17 @@ lets the user choose which one to deploy to.
 """
 
 import base64
+import concurrent.futures
+import functools
 import getpass
 import os
-import platform
+import re
 import shutil
 import sys
 import tempfile
-import urllib.error
-import urllib.request
+import time
+import types
+import urllib.parse
 import uuid
 import zipfile
 
@@ -26,12 +29,32 @@ import zipfile
 # Constants
 # ---------------------------------------------------------------------------
 
-REQUIRED_PLUGIN_FILES = ("__init__.py", "metadata.txt")
+# Files that mark a folder as a QGIS plugin.  metadata.txt comes first: it
+# is QGIS-specific, so it is the check most non-plugin folders fail.
+REQUIRED_PLUGIN_FILES = ("metadata.txt", "__init__.py")
+
+# Folders under plugins/ that are never plugins; skipped by name before any
+# type check.  Hidden folders (".git", ".venv", ...) are skipped as well.
+_NON_PLUGIN_DIRS = frozenset({"__pycache__", "__MACOSX", "node_modules"})
 
 QGIS_REPO_UPLOAD_URL = "https://plugins.qgis.org/api/v1/plugin/upload/"
 
 UPLOAD_TIMEOUT_SECONDS = 60
 
+# Redirects (307/308 only) followed for a single upload.
+MAX_UPLOAD_REDIRECTS = 5
+
+# Attempts, and the first delay (doubled after each failure), for file
+# operations that hit a lock while deploying to a QGIS profile.
+LOCK_RETRY_ATTEMPTS = 5
+LOCK_RETRY_DELAY_SECONDS = 0.1
+
+# Read size used when streaming file data into ZIPs and upload bodies.
+IO_CHUNK_SIZE = 1 << 20
+
+# Upper bound on plugins packaged or deployed concurrently.
+MAX_WORKER_THREADS = 8
+
 # Metadata fields that must be non-empty before uploading to the repository.
 # Names use the original case from metadata.txt for display purposes.
 REQUIRED_METADATA_FOR_UPLOAD = (
@@ -46,36 +69,87 @@ ZIP_EXCLUDE_DIRS = {
 }
 ZIP_EXCLUDE_EXTENSIONS = {".pyc", ".pyo"}
 
+# Already-compressed formats are stored as-is; deflating them again costs
+# CPU time for no size benefit.
+ZIP_STORED_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".zip", ".whl", ".gz", ".xz",
+    ".bz2", ".7z", ".woff", ".woff2", ".mp4", ".qgz",
+}
+
+# Fast deflate level: near-identical ratio on source files, several times
+# faster than the default level 6.
+ZIP_COMPRESS_LEVEL = 1
+
+# Fixed timestamp and permissions for every archive member, so rebuilding
+# an unchanged plugin yields a byte-identical ZIP.
+ZIP_MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_MEMBER_MODE = 0o644
+
+# Suffix tuples for str.endswith(), which tests every suffix in C.
+_ZIP_EXCLUDE_SUFFIXES = tuple(ZIP_EXCLUDE_EXTENSIONS)
+_ZIP_STORED_SUFFIXES = tuple(ZIP_STORED_EXTENSIONS)
+
+# Build artefacts and VCS data that are never deployed to a QGIS profile.
+_DEPLOY_IGNORE = shutil.ignore_patterns(
+    "__pycache__", "*.pyc", "*.pyo", ".git",
+)
+
 # Filenames recognised as a LICENSE file (case-insensitive check).
 LICENSE_FILENAMES = {"license", "license.txt", "licence", "licence.txt"}
 
+# One ``key = value`` line of metadata.txt, surrounding whitespace excluded.
+# Section headers ("[general]") and lines without "=" never match.
+_METADATA_FIELD_RE = re.compile(
+    r"^[^\S\n]*([^\[\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Characters allowed in a numeric menu selection such as "1, 3".
+_CHOICE_CHARS = frozenset("0123456789, ")
+
+# Host platform and home directory, resolved once at import.  The platform
+# name comes from sys.platform, which avoids importing the platform module;
+# the values match platform.system() for the three supported systems.
+_SYSTEM = {
+    "win32": "Windows", "linux": "Linux", "darwin": "Darwin",
+}.get(sys.platform, sys.platform)
+_HOME = os.path.expanduser("~")
+
+# QGIS3 profiles location per platform, relative to %APPDATA% on Windows
+# and to the home directory elsewhere.
+_PROFILES_SUBPATH = {
+    "Windows": ("QGIS", "QGIS3", "profiles"),
+    "Linux": (".local", "share", "QGIS", "QGIS3", "profiles"),
+    "Darwin": (
+        "Library", "Application Support", "QGIS", "QGIS3", "profiles",
+    ),
+}
+
+# Plugin folder inside a profile, pre-joined for plugins_dir_for_profile().
+_PROFILE_PLUGINS_SUBDIR = os.sep.join(("python", "plugins"))
+
 
 # ---------------------------------------------------------------------------
 # Helpers — discovery and profiles
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_qgis_profiles_root():
     """Return the path to the QGIS3 profiles directory for this platform.
 
+    The result is cached; the platform and environment are only consulted
+    on the first call.
+
     Returns:
         str or None if the directory cannot be determined.
     """
-    system = platform.system()
-    if system == "Windows":
-        appdata = os.environ.get("APPDATA", "")
-        if appdata:
-            return os.path.join(appdata, "QGIS", "QGIS3", "profiles")
-    elif system == "Linux":
-        return os.path.join(
-            os.path.expanduser("~"),
-            ".local", "share", "QGIS", "QGIS3", "profiles",
-        )
-    elif system == "Darwin":
-        return os.path.join(
-            os.path.expanduser("~"),
-            "Library", "Application Support", "QGIS", "QGIS3", "profiles",
-        )
-    return None
+    subpath = _PROFILES_SUBPATH.get(_SYSTEM)
+    if subpath is None:
+        return None
+    base = os.environ.get("APPDATA", "") if _SYSTEM == "Windows" else _HOME
+    if not base:
+        return None
+    return os.path.join(base, *subpath)
 
 
 def list_profiles(profiles_root):
@@ -83,19 +157,18 @@ def list_profiles(profiles_root):
 
     Only directories are considered; files like ``profiles.ini`` are skipped.
     """
-    if not os.path.isdir(profiles_root):
+    try:
+        with os.scandir(profiles_root) as it:
+            return sorted(entry.name for entry in it if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(
-        entry
-        for entry in os.listdir(profiles_root)
-        if os.path.isdir(os.path.join(profiles_root, entry))
-    )
 
 
 def plugins_dir_for_profile(profiles_root, profile_name):
     """Return the full path to the ``python/plugins`` folder for a profile."""
-    return os.path.join(
-        profiles_root, profile_name, "python", "plugins",
+    return (
+        f"{profiles_root}{os.sep}{profile_name}{os.sep}"
+        f"{_PROFILE_PLUGINS_SUBDIR}"
     )
 
 
@@ -107,45 +180,97 @@ def discover_plugins(repo_root):
     both ``__init__.py`` and ``metadata.txt`` at its top level.
 
     Returns:
-        list[tuple[str, str]]: (plugin_folder_name, full_path) pairs.
+        list[tuple[str, str, str]]: (plugin_folder_name, full_path,
+        friendly_name) triples.  The friendly name is the metadata
+        ``name`` field, falling back to the folder name.
     """
     plugins_dir = os.path.join(repo_root, "plugins")
-    if not os.path.isdir(plugins_dir):
+    # A missing (or non-directory) plugins/ surfaces from scandir itself,
+    # so no separate isdir() probe is needed.
+    try:
+        with os.scandir(plugins_dir) as it:
+            candidates = sorted(
+                (entry for entry in it
+                 if not entry.name.startswith(".")
+                 and entry.name not in _NON_PLUGIN_DIRS
+                 and entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
     plugins = []
-    for entry in sorted(os.listdir(plugins_dir)):
-        entry_path = os.path.join(plugins_dir, entry)
-        if not os.path.isdir(entry_path):
-            continue
-        if entry.startswith("."):
+    for entry in candidates:
+        # One directory read answers both required-file checks, instead of
+        # a separate stat per required file.
+        try:
+            with os.scandir(entry.path) as child_it:
+                files = {
+                    child.name for child in child_it if child.is_file()
+                }
+        except OSError:
             continue
-        if all(
-            os.path.isfile(os.path.join(entry_path, req))
-            for req in REQUIRED_PLUGIN_FILES
-        ):
-            plugins.append((entry, entry_path))
+        if files.issuperset(REQUIRED_PLUGIN_FILES):
+            friendly = read_plugin_name(entry.path + os.sep + "metadata.txt")
+            plugins.append((entry.name, entry.path, friendly or entry.name))
     return plugins
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_metadata(metadata_path):
+    """Parse all key=value pairs from a QGIS metadata.txt file (cached).
+
+    Each metadata file is read at most once per run; the display-name
+    lookup and the upload validation share the same parsed result.
+
+    Returns:
+        Read-only mapping of lowercase field names to their values.
+    """
+    fields = {}
+    try:
+        # Binary read plus one decode skips the TextIOWrapper layer;
+        # the field regex tolerates the "\r" left by CRLF line endings.
+        with open(metadata_path, "rb") as fh:
+            data = fh.read().decode("utf-8", errors="replace")
+    except OSError:
+        return types.MappingProxyType(fields)
+
+    # One regex pass over the whole text replaces a Python-level loop of
+    # strip/partition calls per line.
+    for key, value in _METADATA_FIELD_RE.findall(data):
+        fields[key.lower()] = value
+    return types.MappingProxyType(fields)
+
+
 def read_plugin_name(metadata_path):
     """Read the ``name`` field from a QGIS metadata.txt file.
 
     Returns the name string, or None if it cannot be read.
     """
-    try:
-        with open(metadata_path, encoding="utf-8", errors="replace") as fh:
-            for line in fh:
-                if line.strip().lower().startswith("name="):
-                    return line.strip().split("=", 1)[1].strip()
-    except OSError:
-        pass
-    return None
+    return _parse_metadata(metadata_path).get("name")
 
 
 # ---------------------------------------------------------------------------
 # Helpers — user interaction
 # ---------------------------------------------------------------------------
 
+def _read_input(prompt):
+    """Print *prompt* and return one line from stdin, without the newline.
+
+    A lean ``input()``: writes and flushes stdout, then reads stdin
+    directly, so piped answers (``echo A | python deploy_plugins.py``)
+    work the same as typed ones.
+
+    Raises:
+        EOFError: If stdin is exhausted.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
 def prompt_choice(prompt_text, options, allow_all=False):
     """Prompt the user to pick one or more numbered options.
 
@@ -166,7 +291,7 @@ def prompt_choice(prompt_text, options, allow_all=False):
 
     while True:
         try:
-            raw = input("\nChoice: ").strip()
+            raw = _read_input("\nChoice: ").strip()
         except (EOFError, KeyboardInterrupt):
             print()
             return None
@@ -180,21 +305,21 @@ def prompt_choice(prompt_text, options, allow_all=False):
         if allow_all and upper == "A":
             return list(range(len(options)))
 
-        # Accept comma-separated numbers.
-        parts = [p.strip() for p in raw.split(",")]
-        indices = []
-        valid = True
-        for part in parts:
-            if not part.isdigit():
-                valid = False
-                break
-            num = int(part) - 1
-            if num < 0 or num >= len(options):
-                valid = False
-                break
-            indices.append(num)
-        if valid and indices:
-            return indices
+        # Accept comma-separated numbers.  One set test rejects anything
+        # else up front; int() then tolerates spaces around each number
+        # but rejects empty parts ("1,,2") and inner spaces ("1 2").
+        # Repeated numbers are dropped (first occurrence kept), so the same
+        # plugin is never handled twice, and min()/max() bound-check the
+        # whole selection at once.
+        if set(raw) <= _CHOICE_CHARS:
+            try:
+                indices = list(dict.fromkeys(
+                    int(part) - 1 for part in raw.split(",")
+                ))
+            except ValueError:
+                indices = []
+            if indices and min(indices) >= 0 and max(indices) < len(options):
+                return indices
 
         print("Invalid selection. Enter a number, comma-separated numbers, "
               f"{'A for all, ' if allow_all else ''}or Q to quit.")
@@ -204,60 +329,243 @@ def prompt_choice(prompt_text, options, allow_all=False):
 # Helpers — local deployment
 # ---------------------------------------------------------------------------
 
-def copy_plugin(src_path, dest_path):
-    """Copy a plugin folder from *src_path* to *dest_path*.
+# Reparse tag of an NTFS directory junction (stat.IO_REPARSE_TAG_MOUNT_POINT).
+_IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
 
-    If *dest_path* already exists the user is asked whether to overwrite.
-    Handles file-lock errors by prompting the user to close the file and
-    retry.
 
-    Returns:
-        True on success, False on skip/failure.
+def _is_junction(entry):
+    """Return True if *entry* is a Windows directory junction.
+
+    A junction is a link, but unlike a symlink it reports
+    ``is_dir(follow_symlinks=False) == True`` and ``is_symlink() == False``,
+    so a tree walk has to check for it explicitly or it descends into the
+    junction's target.
+
+    Args:
+        entry: An ``os.DirEntry`` or a path.
     """
-    plugin_name = os.path.basename(src_path)
+    if _SYSTEM != "Windows":
+        return False
+    try:
+        if isinstance(entry, os.DirEntry):
+            st = entry.stat(follow_symlinks=False)
+        else:
+            st = os.lstat(entry)
+    except OSError:
+        return False
+    return getattr(st, "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT
 
-    if os.path.exists(dest_path):
-        print(f"\n  Plugin folder already exists: {dest_path}")
-        while True:
-            try:
-                answer = input("  Overwrite? (y/n): ").strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                print()
-                return False
-            if answer in ("y", "yes"):
-                break
-            if answer in ("n", "no"):
-                print(f"  Skipped {plugin_name}.")
-                return False
-            print("  Please enter y or n.")
 
-        # Remove existing folder, retrying on lock errors.
-        while True:
-            try:
-                shutil.rmtree(dest_path)
-                break
-            except PermissionError:
-                print(f"\n  Cannot remove {dest_path} — a file may be locked.")
-                try:
-                    input("  Close any programs using it, then press Enter to "
-                          "retry (or Ctrl+C to skip): ")
-                except (EOFError, KeyboardInterrupt):
-                    print(f"\n  Skipped {plugin_name}.")
-                    return False
+def _fast_rmtree(path):
+    """Delete the directory tree at *path*.
+
+    A leaner ``shutil.rmtree``: entry types come from the cached
+    ``os.scandir`` results, so no extra ``stat`` is made per entry.
+    Symlinks and junctions are removed themselves, never followed, so
+    nothing outside *path* is deleted.
 
-    # Copy the plugin folder, retrying on lock errors.
+    Raises:
+        OSError: If any entry cannot be removed.
+    """
+    if _is_junction(path):
+        os.rmdir(path)   # removes the junction, not its target
+        return
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        if _is_junction(entry):
+            os.rmdir(entry.path)
+        elif entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _same_filesystem(path_a, path_b):
+    """Return True if *path_a* and *path_b* live on the same device."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
+def _link_or_copy(src, dst):
+    """``copytree`` copy function that hard-links *src* to *dst*.
+
+    Falls back to a regular ``shutil.copyfile`` if the link cannot be made
+    (e.g. the filesystem does not support hard links).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
+def _confirm_overwrite(dest_path):
+    """Ask whether the existing plugin folder at *dest_path* may be replaced.
+
+    Returns:
+        True if the user agreed, False otherwise.
+    """
+    print(f"\n  Plugin folder already exists: {dest_path}")
     while True:
         try:
-            shutil.copytree(src_path, dest_path)
+            answer = _read_input("  Overwrite? (y/n): ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return False
+        if answer in ("y", "yes"):
             return True
+        if answer in ("n", "no"):
+            print(f"  Skipped {os.path.basename(dest_path)}.")
+            return False
+        print("  Please enter y or n.")
+
+
+def _retry_locked(func, *args):
+    """Call ``func(*args)``, retrying with backoff on ``PermissionError``.
+
+    A file briefly held open by QGIS, an editor or a virus scanner is
+    usually released within a second, so a few short waits resolve most
+    lock errors without involving the user.
+
+    Raises:
+        PermissionError: If the last of :data:`LOCK_RETRY_ATTEMPTS` tries
+            still fails.
+    """
+    delay = LOCK_RETRY_DELAY_SECONDS
+    for _attempt in range(LOCK_RETRY_ATTEMPTS - 1):
+        try:
+            return func(*args)
         except PermissionError:
-            print(f"\n  Cannot copy to {dest_path} — a file may be locked.")
+            time.sleep(delay)
+            delay *= 2
+    return func(*args)
+
+
+def _copy_tree(src_path, dest_path):
+    """Make *dest_path* a copy of the plugin folder *src_path*.
+
+    Non-interactive, so it can run on a worker thread.  An existing
+    *dest_path* is updated in place: files are replaced, anything the
+    source no longer has is pruned, and files that are already hard links
+    to the source are left alone.  The tree is walked explicitly, rather
+    than with ``shutil.copytree``, so a locked file is retried on its own
+    (see :func:`_retry_locked`) instead of failing the whole copy.
+
+    On Linux and macOS, when source and destination are on the same
+    filesystem, files are hard-linked instead of copied so no file data
+    has to be moved.  Bytecode caches and ``.git`` are not copied.
+
+    Raises:
+        OSError: If the copy fails (``PermissionError`` when a file stays
+            locked), or if *dest_path* resolves to *src_path* itself.
+    """
+    # A symlinked or junctioned (e.g. development) checkout in the profile
+    # is replaced, never written through.
+    if _is_junction(dest_path):
+        _retry_locked(os.rmdir, dest_path)
+    elif os.path.islink(dest_path) or os.path.isfile(dest_path):
+        _retry_locked(os.unlink, dest_path)
+    # Reached through a linked parent (e.g. a profile plugins/ folder that
+    # links to the repository), the destination is the source: pruning it
+    # would delete the checkout.
+    if os.path.exists(dest_path) and os.path.samefile(src_path, dest_path):
+        raise OSError(f"{dest_path} is the source folder itself "
+                      f"(linked to {src_path}); nothing to copy.")
+
+    # Plain data copies: shutil.copyfile() uses the platform's in-kernel
+    # copy (sendfile / CopyFile) and skips copy2()'s metadata syscalls,
+    # which plugins do not need.
+    copy_function = shutil.copyfile
+    linking = _SYSTEM != "Windows" and _same_filesystem(
+        src_path, os.path.dirname(dest_path),
+    )
+    if linking:
+        copy_function = _link_or_copy
+
+    stack = [(src_path, dest_path)]
+    while stack:
+        src_dir, dest_dir = stack.pop()
+        try:
+            with os.scandir(dest_dir) as it:
+                existing = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            _retry_locked(os.mkdir, dest_dir)
+            existing = {}
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+        ignored = _DEPLOY_IGNORE(src_dir, [entry.name for entry in entries])
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            target = os.path.join(dest_dir, entry.name)
+            old = existing.pop(entry.name, None)
+            if entry.is_dir():
+                if old is not None and _is_junction(old):
+                    _retry_locked(os.rmdir, target)
+                elif old is not None and not old.is_dir(follow_symlinks=False):
+                    _retry_locked(os.unlink, target)
+                stack.append((entry.path, target))
+                continue
+            if old is not None:
+                if old.is_dir(follow_symlinks=False):
+                    _retry_locked(_fast_rmtree, target)
+                else:
+                    if linking and os.path.samestat(
+                        entry.stat(), old.stat(follow_symlinks=False),
+                    ):
+                        continue   # already linked from an earlier deploy
+                    # Unlink rather than overwrite, so neither a symlink
+                    # nor a hard link left by a linked deploy is written
+                    # through.
+                    _retry_locked(os.unlink, target)
+            _retry_locked(copy_function, entry.path, target)
+        # Prune whatever the source no longer has.
+        for old in existing.values():
+            if old.is_dir(follow_symlinks=False):
+                _retry_locked(_fast_rmtree, old.path)
+            else:
+                _retry_locked(os.unlink, old.path)
+
+
+def _copy_with_retry(src_path, dest_path, locked=False):
+    """Run :func:`_copy_tree`, prompting the user whenever a file is locked.
+
+    The prompt needs a terminal; when stdin is not interactive (e.g. a
+    scripted deployment) a file that stays locked skips the plugin
+    instead of waiting for input that will never come.
+
+    Args:
+        src_path: Plugin folder to copy.
+        dest_path: Destination folder in the QGIS profile.
+        locked: True if a previous attempt already hit a locked file, so
+            the user is prompted before the first try.
+
+    Returns:
+        True on success, False on skip/failure.
+    """
+    plugin_name = os.path.basename(src_path)
+    lock_msg = f"\n  Cannot copy to {dest_path} — a file may be locked."
+    while True:
+        if locked:
+            print(lock_msg)
+            if not sys.stdin.isatty():
+                print(f"  Skipped {plugin_name}.")
+                return False
             try:
-                input("  Close any programs using it, then press Enter to "
-                      "retry (or Ctrl+C to skip): ")
+                _read_input("  Close any programs using it, then press Enter "
+                            "to retry (or Ctrl+C to skip): ")
             except (EOFError, KeyboardInterrupt):
                 print(f"\n  Skipped {plugin_name}.")
                 return False
+        try:
+            _copy_tree(src_path, dest_path)
+            return True
+        except PermissionError:
+            locked = True
         except OSError as exc:
             print(f"\n  Error copying {plugin_name}: {exc}")
             return False
@@ -267,34 +575,13 @@ def copy_plugin(src_path, dest_path):
 # Helpers — repository upload
 # ---------------------------------------------------------------------------
 
-def read_metadata_fields(metadata_path):
-    """Parse all key=value pairs from a QGIS metadata.txt file.
-
-    Returns:
-        dict: Mapping of lowercase field names to their values.
-    """
-    fields = {}
-    try:
-        with open(metadata_path, encoding="utf-8", errors="replace") as fh:
-            for line in fh:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("["):
-                    continue
-                if "=" in stripped:
-                    key, _, value = stripped.partition("=")
-                    fields[key.strip().lower()] = value.strip()
-    except OSError:
-        pass
-    return fields
-
-
 def validate_metadata_for_upload(metadata_path):
     """Check that all required metadata fields are present and non-empty.
 
     Returns:
         list[str]: List of validation error messages (empty if all valid).
     """
-    fields = read_metadata_fields(metadata_path)
+    fields = _parse_metadata(metadata_path)
     errors = []
     for field in REQUIRED_METADATA_FOR_UPLOAD:
         value = fields.get(field.lower(), "")
@@ -306,17 +593,111 @@ def validate_metadata_for_upload(metadata_path):
 def _find_license_in_dir(directory):
     """Return the path to a LICENSE file in *directory*, or None."""
     try:
-        for entry in os.listdir(directory):
-            if entry.lower() in LICENSE_FILENAMES:
-                candidate = os.path.join(directory, entry)
-                if os.path.isfile(candidate):
-                    return candidate
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.lower() in LICENSE_FILENAMES and entry.is_file():
+                    return entry.path
     except OSError:
         pass
     return None
 
 
-def create_plugin_zip(plugin_path, plugin_folder_name,
+def _iter_zip_entries(plugin_path):
+    """Yield the files of *plugin_path* that belong in its ZIP archive.
+
+    Walks the tree with an explicit ``os.scandir`` stack so directory
+    checks use the cached ``DirEntry`` type instead of extra ``stat`` calls.
+    Excluded and hidden directories are pruned by name, and compiled
+    bytecode is skipped.  Entries are yielded in sorted order, files of a
+    directory before its subdirectories.
+
+    Yields:
+        tuple[os.DirEntry, str, bool]: The file entry, its name inside the
+        archive (``<plugin_folder>/...``), and whether it sits at the top
+        level of the plugin.
+    """
+    top = os.path.basename(os.path.normpath(plugin_path))
+    stack = [(plugin_path, top)]
+    while stack:
+        dir_path, arc_dir = stack.pop()
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if (entry.name not in ZIP_EXCLUDE_DIRS
+                        and not entry.name.startswith(".")):
+                    subdirs.append((entry.path, f"{arc_dir}/{entry.name}"))
+            elif entry.is_file():
+                if entry.name.lower().endswith(_ZIP_EXCLUDE_SUFFIXES):
+                    continue
+                yield entry, f"{arc_dir}/{entry.name}", arc_dir == top
+        # Reversed so subdirectories are popped in sorted order.
+        stack.extend(reversed(subdirs))
+
+
+def _tree_latest_mtime(plugin_path):
+    """Return the newest ``st_mtime_ns`` of anything packaged from a plugin.
+
+    Covers the plugin directory itself, every non-excluded subdirectory
+    (so deleted or renamed files are noticed) and every file that
+    :func:`_iter_zip_entries` would package.
+    """
+    latest = os.stat(plugin_path).st_mtime_ns
+    stack = [plugin_path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if (entry.name in ZIP_EXCLUDE_DIRS
+                            or entry.name.startswith(".")):
+                        continue
+                    stack.append(entry.path)
+                elif not entry.is_file():
+                    continue
+                elif entry.name.lower().endswith(_ZIP_EXCLUDE_SUFFIXES):
+                    continue
+                latest = max(latest, entry.stat().st_mtime_ns)
+    return latest
+
+
+def _zip_is_current(zip_path, plugin_path, default_license=None):
+    """Return True if *zip_path* is newer than everything it packages.
+
+    A ZIP in ``dist/`` that was written after the last change to the
+    plugin tree (and to the default LICENSE) can be reused as-is.
+    """
+    try:
+        zip_mtime = os.stat(zip_path).st_mtime_ns
+        latest = _tree_latest_mtime(plugin_path)
+        if default_license:
+            latest = max(latest, os.stat(default_license).st_mtime_ns)
+    except OSError:
+        return False
+    return zip_mtime >= latest
+
+
+def _write_zip_member(zf, src_path, arc_name, compress_type):
+    """Stream *src_path* into *zf* as *arc_name* with fixed metadata.
+
+    Unlike ``ZipFile.write`` this does not stat the source path for its
+    timestamp; every member gets ``ZIP_MEMBER_DATE_TIME`` and
+    ``ZIP_MEMBER_MODE`` instead.
+    """
+    info = zipfile.ZipInfo(arc_name, date_time=ZIP_MEMBER_DATE_TIME)
+    info.compress_type = compress_type
+    # Same attribute ZipFile.write() sets; ZipInfo has no public setter
+    # before Python 3.13.
+    info._compresslevel = ZIP_COMPRESS_LEVEL
+    info.external_attr = ZIP_MEMBER_MODE << 16
+    with open(src_path, "rb") as src:
+        # Size from the open handle lets zipfile choose ZIP64 correctly.
+        info.file_size = os.fstat(src.fileno()).st_size
+        with zf.open(info, "w") as dst:
+            shutil.copyfileobj(src, dst, IO_CHUNK_SIZE)
+
+
+def create_plugin_zip(plugin_path, plugin_folder_name, zip_path,
                       default_license=None):
     """Package a plugin directory as a ZIP file for repository upload.
 
@@ -331,47 +712,72 @@ def create_plugin_zip(plugin_path, plugin_folder_name,
     Args:
         plugin_path: Full path to the plugin source directory.
         plugin_folder_name: Name used as the top-level directory in the ZIP.
+        zip_path: Path the ZIP file is written to.  The archive is written
+            in place, so callers should pick a path on the filesystem where
+            the ZIP will finally live.
         default_license: Optional path to a default LICENSE file to include
             when the plugin does not have its own.
 
     Returns:
-        str: Path to the temporary ZIP file.
+        bool: True if *default_license* was added to the archive.
     """
-    tmp_dir = tempfile.mkdtemp(prefix="qgis_plugin_")
-    zip_path = os.path.join(tmp_dir, f"{plugin_folder_name}.zip")
-
     has_license = False
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(plugin_path):
-            # Prune excluded directories in-place.
-            dirs[:] = [
-                d for d in dirs
-                if d not in ZIP_EXCLUDE_DIRS and not d.startswith(".")
-            ]
-            for filename in files:
-                _, ext = os.path.splitext(filename)
-                if ext.lower() in ZIP_EXCLUDE_EXTENSIONS:
-                    continue
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(
-                    file_path, os.path.dirname(plugin_path),
-                )
-                zf.write(file_path, rel_path)
-                # Track whether a LICENSE file was included.
-                if (root == plugin_path
-                        and filename.lower() in LICENSE_FILENAMES):
-                    has_license = True
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESS_LEVEL) as zf:
+        for entry, arc_name, is_top_level in _iter_zip_entries(plugin_path):
+            lower = entry.name.lower()
+            if lower.endswith(_ZIP_STORED_SUFFIXES):
+                compress_type = zipfile.ZIP_STORED
+            else:
+                compress_type = zipfile.ZIP_DEFLATED
+            _write_zip_member(zf, entry.path, arc_name, compress_type)
+            # Track whether a LICENSE file was included.
+            if is_top_level and lower in LICENSE_FILENAMES:
+                has_license = True
 
         # Inject default LICENSE if the plugin does not have one.
         if not has_license and default_license:
             if os.path.isfile(default_license):
-                license_rel = os.path.join(plugin_folder_name, "LICENSE")
-                zf.write(default_license, license_rel)
-                print(f"  LICENSE not found in plugin — added default "
-                      f"from {default_license}")
+                _write_zip_member(
+                    zf, default_license, f"{plugin_folder_name}/LICENSE",
+                    zipfile.ZIP_DEFLATED,
+                )
+                return True
+
+    return False
 
-    return zip_path
+
+def _worker_pool(count):
+    """Return a thread pool for handling up to *count* plugins at once.
+
+    Packaging and copying are file I/O plus deflate, and both the OS calls
+    and zlib release the GIL, so threads overlap the work across plugins.
+    """
+    workers = max(1, min(MAX_WORKER_THREADS, count))
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+
+def _zip_result(future):
+    """Wait for a :func:`create_plugin_zip` job.
+
+    Returns:
+        tuple: (added_default_license, error) where *error* is the
+        ``OSError`` raised while packaging, or None on success.
+    """
+    try:
+        return future.result(), None
+    except OSError as exc:
+        return False, exc
+
+
+def _print_metadata_errors(label, errors):
+    """Report why a plugin failed upload metadata validation."""
+    print(f"\n  {label}")
+    print("  Missing required metadata fields:")
+    for err in errors:
+        print(err)
+    print("  Skipping — update metadata.txt before uploading.")
 
 
 def load_env_file(repo_root):
@@ -384,23 +790,23 @@ def load_env_file(repo_root):
         repo_root: Repository root directory containing the ``.env`` file.
     """
     env_path = os.path.join(repo_root, ".env")
-    if not os.path.isfile(env_path):
-        return
+    # A missing file surfaces as OSError from open(); no separate probe.
     try:
         with open(env_path, encoding="utf-8", errors="replace") as fh:
-            for line in fh:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                if "=" not in stripped:
-                    continue
-                key, _, value = stripped.partition("=")
-                key = key.strip()
-                value = value.strip()
-                if key and key not in os.environ:
-                    os.environ[key] = value
+            data = fh.read()
     except OSError:
-        pass
+        return
+
+    pairs = {}
+    for line in data.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or "=" not in stripped:
+            continue
+        key, _, value = stripped.partition("=")
+        key = key.strip()
+        if key and key not in os.environ:
+            pairs.setdefault(key, value.strip())
+    os.environ.update(pairs)
 
 
 def get_osgeo_credentials():
@@ -426,7 +832,7 @@ def get_osgeo_credentials():
         print(f"  Username from OSGEO_USERNAME: {username}")
     else:
         try:
-            username = input("  OSGeo username: ").strip()
+            username = _read_input("  OSGeo username: ").strip()
         except (EOFError, KeyboardInterrupt):
             print()
             return None
@@ -446,63 +852,263 @@ def get_osgeo_credentials():
     return username, password
 
 
-def upload_plugin_to_repository(zip_path, username, password):
-    """Upload a plugin ZIP to the official QGIS plugin repository.
+class RepoUploader:
+    """Upload plugin ZIPs to the official QGIS plugin repository.
 
     Uses HTTP Basic authentication with the provided OSGeo credentials.
+    The Authorization header is encoded once, and a single HTTP/1.1
+    connection is kept alive across uploads so only the first upload pays
+    for the TLS handshake.  Proxies configured through the usual
+    ``HTTPS_PROXY``/``HTTP_PROXY``/``NO_PROXY`` environment variables are
+    honoured, and 307/308 redirects within the same origin are followed
+    for the upload that received them.  Use as a context manager, or
+    call :meth:`close` when done.
 
     Args:
-        zip_path: Path to the plugin ZIP file.
         username: OSGeo username.
         password: OSGeo password.
-
-    Returns:
-        tuple[bool, str]: (success, message).
+        url: Upload endpoint (defaults to ``QGIS_REPO_UPLOAD_URL``).
     """
-    filename = os.path.basename(zip_path)
-
-    with open(zip_path, "rb") as fh:
-        zip_data = fh.read()
-
-    # Build multipart/form-data body.
-    boundary = uuid.uuid4().hex
-    body = (
-        f"--{boundary}\r\n"
-        f'Content-Disposition: form-data; name="package"; '
-        f'filename="{filename}"\r\n'
-        f"Content-Type: application/zip\r\n"
-        f"\r\n"
-    ).encode("utf-8") + zip_data + f"\r\n--{boundary}--\r\n".encode("utf-8")
-
-    credentials = base64.b64encode(
-        f"{username}:{password}".encode("utf-8"),
-    ).decode("ascii")
-
-    request = urllib.request.Request(
-        QGIS_REPO_UPLOAD_URL,
-        data=body,
-        headers={
-            "Content-Type": f"multipart/form-data; boundary={boundary}",
-            "Authorization": f"Basic {credentials}",
-        },
-        method="POST",
-    )
 
-    try:
-        response = urllib.request.urlopen(
-            request, timeout=UPLOAD_TIMEOUT_SECONDS,
+    def __init__(self, username, password, url=None):
+        credentials = base64.b64encode(
+            f"{username}:{password}".encode("utf-8"),
+        ).decode("ascii")
+        self._auth_header = f"Basic {credentials}"
+        self._conn = None
+        self._base_url = url or QGIS_REPO_UPLOAD_URL
+        self._set_target(self._base_url)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the underlying connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _origin(url):
+        """Return (scheme, host, port) of *url*, with the default port
+        filled in."""
+        parts = urllib.parse.urlsplit(url)
+        default_port = 443 if parts.scheme == "https" else 80
+        return (
+            parts.scheme, (parts.hostname or "").lower(),
+            parts.port or default_port,
+        )
+
+    def _set_target(self, url):
+        """Point the uploader at *url*, dropping a connection to another
+        host."""
+        parts = urllib.parse.urlsplit(url)
+        origin = (parts.scheme, parts.netloc)
+        if self._conn is not None and origin != (self._scheme, self._netloc):
+            self.close()
+        self._url = url
+        self._scheme, self._netloc = origin
+        self._hostname = parts.hostname
+        self._port = parts.port
+        self._path = urllib.parse.urlunsplit(
+            ("", "", parts.path or "/", parts.query, ""),
+        )
+
+    def _connection(self):
+        """Return the open connection, creating it on first use.
+
+        The proxy is looked up the same way ``urllib`` does.  HTTPS is
+        tunnelled through it with CONNECT; plain HTTP is sent to the
+        proxy with the absolute URL as the request target.
+
+        Returns:
+            tuple: (connection, request target, extra request headers).
+        """
+        import http.client
+        import urllib.request
+
+        conn_class = (
+            http.client.HTTPSConnection if self._scheme == "https"
+            else http.client.HTTPConnection
         )
-        return True, f"HTTP {response.status} — upload accepted."
-    except urllib.error.HTTPError as exc:
+        proxy = urllib.request.getproxies().get(self._scheme)
+        if not proxy or urllib.request.proxy_bypass(self._hostname):
+            if self._conn is None:
+                self._conn = conn_class(
+                    self._netloc, timeout=UPLOAD_TIMEOUT_SECONDS,
+                )
+            return self._conn, self._path, ()
+
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        proxy_parts = urllib.parse.urlsplit(proxy)
+        proxy_headers = {}
+        if proxy_parts.username is not None:
+            proxy_credentials = base64.b64encode(
+                "{}:{}".format(
+                    urllib.parse.unquote(proxy_parts.username),
+                    urllib.parse.unquote(proxy_parts.password or ""),
+                ).encode("utf-8"),
+            ).decode("ascii")
+            proxy_headers["Proxy-Authorization"] = (
+                f"Basic {proxy_credentials}"
+            )
+
+        if self._scheme == "https":
+            if self._conn is None:
+                self._conn = conn_class(
+                    proxy_parts.hostname, proxy_parts.port,
+                    timeout=UPLOAD_TIMEOUT_SECONDS,
+                )
+                self._conn.set_tunnel(
+                    self._hostname, self._port, headers=proxy_headers,
+                )
+            return self._conn, self._path, ()
+
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(
+                proxy_parts.hostname, proxy_parts.port,
+                timeout=UPLOAD_TIMEOUT_SECONDS,
+            )
+        return self._conn, self._url, tuple(proxy_headers.items())
+
+    def upload(self, zip_path):
+        """Upload one plugin ZIP.
+
+        The ZIP is streamed from disk between the multipart header and
+        footer rather than held in memory.
+
+        Args:
+            zip_path: Path to the plugin ZIP file.
+
+        Returns:
+            tuple[bool, str]: (success, message).
+        """
+        filename = os.path.basename(zip_path)
+
+        # A redirect only applies to the upload that received it.
+        self._set_target(self._base_url)
+
+        # Build the multipart/form-data framing.
+        boundary = uuid.uuid4().hex
+        header = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="package"; '
+            f'filename="{filename}"\r\n'
+            f"Content-Type: application/zip\r\n"
+            f"\r\n"
+        ).encode("utf-8")
+        footer = f"\r\n--{boundary}--\r\n".encode("utf-8")
         try:
-            detail = exc.read().decode("utf-8", errors="replace")
-        except Exception:
-            detail = ""
-        return False, f"HTTP {exc.code}: {exc.reason}. {detail}".strip()
-    except urllib.error.URLError as exc:
-        return False, f"Connection error: {exc.reason}"
-    except OSError as exc:
-        return False, f"Network error: {exc}"
+            content_length = (
+                len(header) + os.path.getsize(zip_path) + len(footer)
+            )
+        except OSError as exc:
+            return False, f"Cannot read {filename}: {exc}"
+
+        headers = (
+            ("Content-Type", f"multipart/form-data; boundary={boundary}"),
+            ("Content-Length", str(content_length)),
+            ("Authorization", self._auth_header),
+        )
+
+        # 307 and 308 ask for the same POST to be repeated elsewhere; the
+        # body is re-read from disk.  Other redirects would turn the
+        # upload into a GET, so they are reported like any other failure.
+        # The request carries the OSGeo credentials, so it is only
+        # repeated on the same origin (scheme, host and port); that also
+        # rules out an https -> http downgrade.
+        for _ in range(MAX_UPLOAD_REDIRECTS + 1):
+            ok, result = self._post(zip_path, headers, header, footer)
+            if not ok:
+                return False, result
+            response, detail = result
+            location = response.getheader("Location")
+            if response.status not in (307, 308) or not location:
+                break
+            new_url = urllib.parse.urljoin(self._url, location)
+            if self._origin(new_url) != self._origin(self._url):
+                return False, (
+                    f"HTTP {response.status}: redirected to {new_url}; "
+                    "not following a redirect to another site with "
+                    "your credentials."
+                )
+            self._set_target(new_url)
+        else:
+            return False, "Connection error: too many redirects"
+
+        if 200 <= response.status < 300:
+            return True, f"HTTP {response.status} — upload accepted."
+        return False, (
+            f"HTTP {response.status}: {response.reason}. {detail}".strip()
+        )
+
+    def _post(self, zip_path, headers, header, footer):
+        """Send one multipart POST of *zip_path* to the current target.
+
+        Returns:
+            tuple[bool, object]: (True, (response, body text)) once a
+            response arrives, or (False, error message).
+        """
+        # Imported here rather than at module level: http.client pulls in
+        # the email package, the bulk of the script's start-up time, and
+        # only the upload flow needs it.
+        import http.client
+
+        # One reusable buffer for the file data instead of a new bytes
+        # object per chunk.  The multipart header is copied in front of
+        # the first chunk so the two go out in one send() rather than the
+        # header as a tiny write of its own.
+        header_size = len(header)
+        buf = bytearray(header_size + IO_CHUNK_SIZE)
+        view = memoryview(buf)
+
+        # A kept-alive connection may have been closed by the server while
+        # idle; retry once on a fresh connection in that case.
+        reused = self._conn is not None
+        while True:
+            conn, target, extra_headers = self._connection()
+            try:
+                conn.putrequest("POST", target)
+                for name, value in headers + extra_headers:
+                    conn.putheader(name, value)
+                conn.endheaders()
+                view[:header_size] = header
+                offset = header_size
+                with open(zip_path, "rb", buffering=0) as fh:
+                    while True:
+                        size = fh.readinto(view[offset:])
+                        if not size:
+                            break
+                        conn.send(view[:offset + size])
+                        offset = 0
+                if offset:
+                    # Empty file: the header was never sent.
+                    conn.send(header)
+                conn.send(footer)
+                response = conn.getresponse()
+                # Drain the body so the connection can be reused.
+                detail = response.read().decode("utf-8", errors="replace")
+            except (http.client.RemoteDisconnected, ConnectionError):
+                self.close()
+                if reused:
+                    reused = False
+                    continue
+                return False, "Connection error: server closed the connection"
+            except http.client.HTTPException as exc:
+                self.close()
+                return False, f"Connection error: {exc}"
+            except OSError as exc:
+                self.close()
+                return False, f"Network error: {exc}"
+            break
+
+        if response.will_close:
+            self.close()
+        return True, (response, detail)
 
 
 def prepare_upload_flow(plugins, display, repo_root):
@@ -513,7 +1119,7 @@ def prepare_upload_flow(plugins, display, repo_root):
     upload the ZIP manually via https://plugins.qgis.org/plugins/add/.
 
     Args:
-        plugins: List of (folder_name, folder_path) tuples.
+        plugins: List of (folder_name, folder_path, friendly_name) tuples.
         display: List of display strings for each plugin.
         repo_root: Repository root directory.
     """
@@ -530,124 +1136,119 @@ def prepare_upload_flow(plugins, display, repo_root):
         print("Aborted.")
         return
 
-    # --- Validate metadata ---
-    ready = []
-    for idx in selection:
-        folder_name, folder_path = plugins[idx]
-        meta_path = os.path.join(folder_path, "metadata.txt")
-        errors = validate_metadata_for_upload(meta_path)
-        if errors:
-            print(f"\n  {display[idx]}")
-            print("  Missing required metadata fields:")
-            for err in errors:
-                print(err)
-            print("  Skipping — update metadata.txt before uploading.")
-        else:
-            ready.append(idx)
-
-    if not ready:
-        print("\nNo plugins passed metadata validation.")
-        return
-
-    if len(ready) < len(selection):
-        print(f"\n{len(ready)} of {len(selection)} plugin(s) passed "
-              "metadata validation.")
-
-    # --- Locate default LICENSE ---
     default_license = _find_license_in_dir(repo_root)
-
-    # --- Create dist/ folder ---
     dist_dir = os.path.join(repo_root, "dist")
-    os.makedirs(dist_dir, exist_ok=True)
 
-    # --- Package ---
-    prepared = 0
-    for idx in ready:
-        folder_name, folder_path = plugins[idx]
-        print(f"\nPackaging {display[idx]} ...")
-        try:
-            tmp_zip = create_plugin_zip(
-                folder_path, folder_name,
-                default_license=default_license,
+    with _worker_pool(len(selection)) as pool:
+        # --- Validate metadata and start packaging in one pass ---
+        # Each ZIP is written next to its final name (``.part``) and only
+        # swapped into place once the user has confirmed any overwrite.
+        # A ZIP already newer than its plugin tree is reused (future None).
+        ready = []   # [(idx, dest_zip, future)]
+        for idx in selection:
+            folder_name, folder_path, _friendly = plugins[idx]
+            errors = validate_metadata_for_upload(
+                os.path.join(folder_path, "metadata.txt"),
             )
-        except OSError as exc:
-            print(f"  Error creating ZIP: {exc}")
-            continue
-
-        dest_zip = os.path.join(dist_dir, f"{folder_name}.zip")
+            if errors:
+                _print_metadata_errors(display[idx], errors)
+                continue
+            if not ready:
+                os.makedirs(dist_dir, exist_ok=True)
+            dest_zip = os.path.join(dist_dir, f"{folder_name}.zip")
+            if _zip_is_current(dest_zip, folder_path, default_license):
+                future = None
+            else:
+                future = pool.submit(
+                    create_plugin_zip, folder_path, folder_name,
+                    dest_zip + ".part", default_license=default_license,
+                )
+            ready.append((idx, dest_zip, future))
 
-        # Handle existing ZIP with overwrite prompt and file-lock retry.
-        if os.path.isfile(dest_zip):
-            overwrite = False
-            while True:
-                try:
-                    answer = input(
-                        f"  {os.path.basename(dest_zip)} already exists in "
-                        "dist/. Overwrite? (y/n): "
-                    ).strip().lower()
-                except (EOFError, KeyboardInterrupt):
-                    print()
-                    break
-                if answer in ("y", "yes"):
-                    overwrite = True
-                    break
-                if answer in ("n", "no"):
-                    print(f"  Skipped {folder_name}.")
-                    break
-                print("  Please enter y or n.")
+        if not ready:
+            print("\nNo plugins passed metadata validation.")
+            return
 
-            if not overwrite:
+        if len(ready) < len(selection):
+            print(f"\n{len(ready)} of {len(selection)} plugin(s) passed "
+                  "metadata validation.")
+
+        # --- Confirm and move into dist/ ---
+        prepared = 0
+        for idx, dest_zip, future in ready:
+            folder_name = plugins[idx][0]
+            part_zip = dest_zip + ".part"
+            print(f"\nPackaging {display[idx]} ...")
+            if future is None:
+                print(f"  dist/{os.path.basename(dest_zip)} is up to date "
+                      "— no changes since it was built.")
+                prepared += 1
+                continue
+            added_license, error = _zip_result(future)
+            if error is not None:
+                print(f"  Error creating ZIP: {error}")
                 try:
-                    shutil.rmtree(os.path.dirname(tmp_zip))
+                    os.remove(part_zip)
                 except OSError:
                     pass
                 continue
+            if added_license:
+                print(f"  LICENSE not found in plugin — added default "
+                      f"from {default_license}")
 
-            while True:
+            # Handle existing ZIP with overwrite prompt and file-lock retry.
+            overwrite = True
+            if os.path.isfile(dest_zip):
+                overwrite = False
+                while True:
+                    try:
+                        answer = _read_input(
+                            f"  {os.path.basename(dest_zip)} already exists "
+                            "in dist/. Overwrite? (y/n): "
+                        ).strip().lower()
+                    except (EOFError, KeyboardInterrupt):
+                        print()
+                        break
+                    if answer in ("y", "yes"):
+                        overwrite = True
+                        break
+                    if answer in ("n", "no"):
+                        print(f"  Skipped {folder_name}.")
+                        break
+                    print("  Please enter y or n.")
+
+            replaced = False
+            while overwrite:
                 try:
-                    os.remove(dest_zip)
+                    os.replace(part_zip, dest_zip)
+                    replaced = True
                     break
                 except PermissionError:
                     print(f"\n  Cannot overwrite {dest_zip} — file may be "
                           "locked.")
                     try:
-                        input("  Close any programs using it, then press "
-                              "Enter to retry (or Ctrl+C to skip): ")
+                        _read_input(
+                            "  Close any programs using it, then press "
+                            "Enter to retry (or Ctrl+C to skip): "
+                        )
                     except (EOFError, KeyboardInterrupt):
                         print(f"\n  Skipped {folder_name}.")
                         break
                 except OSError as exc:
-                    print(f"  Error removing existing ZIP: {exc}")
+                    print(f"  Error moving ZIP to dist/: {exc}")
                     break
 
-            if os.path.isfile(dest_zip):
+            if not replaced:
                 try:
-                    shutil.rmtree(os.path.dirname(tmp_zip))
+                    os.remove(part_zip)
                 except OSError:
                     pass
                 continue
 
-        # Move ZIP from temp to dist/.
-        try:
-            shutil.move(tmp_zip, dest_zip)
-        except OSError as exc:
-            print(f"  Error moving ZIP to dist/: {exc}")
-            try:
-                shutil.rmtree(os.path.dirname(tmp_zip))
-            except OSError:
-                pass
-            continue
-
-        # Clean up temp directory.
-        try:
-            shutil.rmtree(os.path.dirname(tmp_zip))
-        except OSError:
-            pass
-
-        zip_size = os.path.getsize(dest_zip)
-        print(f"  Created dist/{os.path.basename(dest_zip)} "
-              f"({zip_size / 1024:.1f} KB)")
-        prepared += 1
+            zip_size = os.path.getsize(dest_zip)
+            print(f"  Created dist/{os.path.basename(dest_zip)} "
+                  f"({zip_size / 1024:.1f} KB)")
+            prepared += 1
 
     # --- Summary ---
     print(f"\n{'=' * 60}")
@@ -667,7 +1268,7 @@ def upload_flow(plugins, display, repo_root):
     as a ZIP, and uploads it to the official QGIS plugin repository.
 
     Args:
-        plugins: List of (folder_name, folder_path) tuples.
+        plugins: List of (folder_name, folder_path, friendly_name) tuples.
         display: List of display strings for each plugin.
         repo_root: Repository root directory.
     """
@@ -679,74 +1280,86 @@ def upload_flow(plugins, display, repo_root):
         print("Aborted.")
         return
 
-    # --- Validate metadata ---
-    ready = []
-    for idx in selection:
-        folder_name, folder_path = plugins[idx]
-        meta_path = os.path.join(folder_path, "metadata.txt")
-        errors = validate_metadata_for_upload(meta_path)
-        if errors:
-            print(f"\n  {display[idx]}")
-            print("  Missing required metadata fields:")
-            for err in errors:
-                print(err)
-            print("  Skipping — update metadata.txt before uploading.")
-        else:
-            ready.append(idx)
+    default_license = _find_license_in_dir(repo_root)
 
-    if not ready:
-        print("\nNo plugins passed metadata validation.")
-        return
+    # ZIPs are only needed for the upload itself, so they are built in a
+    # private temp directory that keeps each upload filename intact.
+    tmp_dir = tempfile.mkdtemp(prefix="qgis_plugin_")
+    pool = _worker_pool(len(selection))
+    ready = []   # [(idx, zip_path, future)]
+    try:
+        # --- Validate metadata and start packaging in one pass ---
+        # Packaging runs in the background while credentials are entered.
+        for idx in selection:
+            folder_name, folder_path, _friendly = plugins[idx]
+            errors = validate_metadata_for_upload(
+                os.path.join(folder_path, "metadata.txt"),
+            )
+            if errors:
+                _print_metadata_errors(display[idx], errors)
+                continue
+            zip_path = os.path.join(tmp_dir, f"{folder_name}.zip")
+            future = pool.submit(
+                create_plugin_zip, folder_path, folder_name, zip_path,
+                default_license=default_license,
+            )
+            ready.append((idx, zip_path, future))
 
-    if len(ready) < len(selection):
-        print(f"\n{len(ready)} of {len(selection)} plugin(s) passed "
-              "metadata validation.")
+        if not ready:
+            print("\nNo plugins passed metadata validation.")
+            return
 
-    # --- Credentials ---
-    creds = get_osgeo_credentials()
-    if creds is None:
-        print("Aborted.")
-        return
-    username, password = creds
+        if len(ready) < len(selection):
+            print(f"\n{len(ready)} of {len(selection)} plugin(s) passed "
+                  "metadata validation.")
 
-    # --- Locate default LICENSE ---
-    default_license = _find_license_in_dir(repo_root)
+        # --- Credentials ---
+        creds = get_osgeo_credentials()
+        if creds is None:
+            print("Aborted.")
+            return
+        username, password = creds
+
+        # --- Upload ---
+        uploaded = 0
+        with RepoUploader(username, password) as uploader:
+            for idx, zip_path, future in ready:
+                print(f"\nPackaging {display[idx]} ...")
+                added_license, error = _zip_result(future)
+                if error is not None:
+                    print(f"  Error creating ZIP: {error}")
+                    continue
+                if added_license:
+                    print(f"  LICENSE not found in plugin — added default "
+                          f"from {default_license}")
 
-    # --- Package and upload ---
-    uploaded = 0
-    for idx in ready:
-        folder_name, folder_path = plugins[idx]
-        print(f"\nPackaging {display[idx]} ...")
-        try:
-            zip_path = create_plugin_zip(
-                folder_path, folder_name,
-                default_license=default_license,
-            )
-        except OSError as exc:
-            print(f"  Error creating ZIP: {exc}")
-            continue
+                zip_size = os.path.getsize(zip_path)
+                print(f"  Created {os.path.basename(zip_path)} "
+                      f"({zip_size / 1024:.1f} KB)")
 
-        zip_size = os.path.getsize(zip_path)
-        print(f"  Created {os.path.basename(zip_path)} "
-              f"({zip_size / 1024:.1f} KB)")
+                print(f"  Uploading to {QGIS_REPO_UPLOAD_URL} ...")
+                success, message = uploader.upload(zip_path)
 
-        print(f"  Uploading to {QGIS_REPO_UPLOAD_URL} ...")
-        success, message = upload_plugin_to_repository(
-            zip_path, username, password,
-        )
+                # Clean up temp file.
+                try:
+                    os.remove(zip_path)
+                except OSError:
+                    pass
 
-        # Clean up temp file.
+                if success:
+                    print(f"  Upload successful: {message}")
+                    uploaded += 1
+                else:
+                    print(f"  Upload failed: {message}")
+    finally:
+        for _idx, _zip_path, future in ready:
+            future.cancel()
+        pool.shutdown(wait=True)
         try:
-            shutil.rmtree(os.path.dirname(zip_path))
+            _fast_rmtree(tmp_dir)
         except OSError:
             pass
 
-        if success:
-            print(f"  Upload successful: {message}")
-            uploaded += 1
-        else:
-            print(f"  Upload failed: {message}")
-
     # --- Summary ---
     print(f"\n{'=' * 60}")
     print(f"  {uploaded} of {len(ready)} plugin(s) uploaded successfully.")
@@ -768,7 +1381,7 @@ def deploy_local_flow(plugins, display):
     then copies selected plugins into that profile's plugin folder.
 
     Args:
-        plugins: List of (folder_name, folder_path) tuples.
+        plugins: List of (folder_name, folder_path, friendly_name) tuples.
         display: List of display strings for each plugin.
     """
     # --- Locate QGIS profiles directory ---
@@ -777,7 +1390,7 @@ def deploy_local_flow(plugins, display):
         print("\nCould not locate the QGIS3 profiles directory.")
         while True:
             try:
-                custom = input(
+                custom = _read_input(
                     "Enter the full path to the QGIS3 profiles directory "
                     "(or Q to quit): "
                 ).strip().strip('"').strip("'")
@@ -808,7 +1421,15 @@ def deploy_local_flow(plugins, display):
         profile = profiles[selection[0]]
 
     target_plugins_dir = plugins_dir_for_profile(profiles_root, profile)
-    os.makedirs(target_plugins_dir, exist_ok=True)
+    # The profile folder was just listed, so usually only the plugins/
+    # leaf (if anything) is missing; makedirs() is the fallback for a
+    # profile without python/ yet.
+    try:
+        os.mkdir(target_plugins_dir)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(target_plugins_dir, exist_ok=True)
     print(f"Target directory: {target_plugins_dir}")
 
     # --- Select plugins to deploy ---
@@ -819,16 +1440,39 @@ def deploy_local_flow(plugins, display):
         print("Aborted.")
         return
 
-    # --- Deploy ---
-    deployed = 0
+    # --- Confirm overwrites up front, so the copies can run unattended ---
+    jobs = []   # [(idx, folder_path, dest)]
     for idx in selection:
-        folder_name, folder_path = plugins[idx]
+        folder_name, folder_path, _friendly = plugins[idx]
         dest = os.path.join(target_plugins_dir, folder_name)
-        friendly = display[idx]
-        print(f"\nDeploying {friendly} ...")
-        if copy_plugin(folder_path, dest):
-            print(f"  Installed to {dest}")
-            deployed += 1
+        if os.path.exists(dest) and not _confirm_overwrite(dest):
+            continue
+        jobs.append((idx, folder_path, dest))
+
+    # --- Deploy ---
+    # Plugins are copied concurrently; results are reported in selection
+    # order, and a locked file falls back to the interactive retry loop.
+    deployed = 0
+    with _worker_pool(len(jobs)) as pool:
+        futures = [
+            (idx, folder_path, dest,
+             pool.submit(_copy_tree, folder_path, dest))
+            for idx, folder_path, dest in jobs
+        ]
+        for idx, folder_path, dest, future in futures:
+            print(f"\nDeploying {display[idx]} ...")
+            try:
+                future.result()
+                ok = True
+            except PermissionError:
+                ok = _copy_with_retry(folder_path, dest, locked=True)
+            except OSError as exc:
+                print(f"\n  Error copying {os.path.basename(folder_path)}: "
+                      f"{exc}")
+                ok = False
+            if ok:
+                print(f"  Installed to {dest}")
+                deployed += 1
 
     # --- Summary ---
     print(f"\n{'=' * 60}")
@@ -865,11 +1509,10 @@ def main():
         sys.exit(0)
 
     # --- Build display names ---
-    display = []
-    for folder_name, folder_path in plugins:
-        meta_path = os.path.join(folder_path, "metadata.txt")
-        friendly = read_plugin_name(meta_path) or folder_name
-        display.append(f"{friendly}  ({folder_name}/)")
+    display = [
+        f"{friendly}  ({folder_name}/)"
+        for folder_name, _folder_path, friendly in plugins
+    ]
 
     # --- Choose action ---
     action = prompt_choice("What would you like to do?", [
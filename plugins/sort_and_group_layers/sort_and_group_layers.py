@@ -23,6 +23,11 @@ Script created by Australis Asset Advisory Group.
 """
 
 import os
+import re
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # QGIS 4 / Qt6 compatibility: QAction moved from QtWidgets to QtGui.
 try:
@@ -77,6 +82,47 @@ _GEOMETRY_GROUP_NAMES = {
     _GEOM_UNKNOWN: "Unknown Geometry",
 }
 
+# Group-by-geometry categories: the geometry types above plus rasters and
+# everything else, with their group order and names.
+_CATEGORY_RASTER = "raster"
+_CATEGORY_OTHER = "other"
+
+_CATEGORY_SORT_ORDER = dict(_GEOMETRY_SORT_ORDER)
+_CATEGORY_SORT_ORDER.update({_CATEGORY_RASTER: 90, _CATEGORY_OTHER: 99})
+
+_CATEGORY_GROUP_NAMES = dict(_GEOMETRY_GROUP_NAMES)
+_CATEGORY_GROUP_NAMES.update({
+    _CATEGORY_RASTER: "Raster Layers",
+    _CATEGORY_OTHER: "Other Layers",
+})
+
+
+# Data providers whose layers never come from a local file.  Their source
+# strings are connection parameters or URLs, so no file path is extracted.
+_NON_FILE_PROVIDERS = frozenset({
+    "arcgisfeatureserver", "arcgismapserver", "hana", "memory", "mssql",
+    "oapif", "oracle", "postgres", "postgresraster", "wcs", "WFS", "wfs",
+    "wms",
+})
+
+# A leading file:// URL scheme, plus the slash before a Windows drive
+# letter in file:///C:/... URLs.
+_FILE_URL_PREFIX_RE = re.compile(r"^file://(?:/(?=.:))?")
+
+_WEB_URL_PREFIXES = ("http://", "https://")
+
+# On Windows os.scandir() returns each entry's stat data with the directory
+# listing itself, so one scan per folder can stand in for a stat call per
+# layer file.  Elsewhere DirEntry.stat() is a stat call of its own.
+_SCANDIR_HAS_STAT = os.name == "nt"
+
+# Upper bound on threads used to prefetch file metadata before a date or
+# size sort.  stat() releases the GIL, so on network drives the calls
+# overlap their round trips.  Below the minimum job count the thread
+# start-up costs more than it saves, and the stats are left to the sort.
+_STAT_PREFETCH_WORKERS = 32
+_STAT_PREFETCH_MIN_JOBS = 8
+
 
 class SortAndGroupLayersPlugin:
     """QGIS plugin to sort and group layers in the Layers panel.
@@ -96,13 +142,23 @@ class SortAndGroupLayersPlugin:
             iface: QgisInterface instance providing access to the QGIS GUI.
         """
         self.iface = iface
+        self.layer_menu = None
         self.sort_menu = None
         self.group_menu = None
         self.sort_menu_action = None
         self.group_menu_action = None
         self.actions = []
         self.original_order_nodes = None
-        self._saved_layers = None
+
+        # Decoded file paths, {(providerType, source): path}; see
+        # _get_file_path().  Cleared when the project is cleared.
+        self._file_paths = {}
+
+        # Per-sort caches consulted by _stat_file(), None outside a sort:
+        # directory listings, {folder: {name: stat_result}} (Windows),
+        # and prefetched file metadata, {path: stat_result or None}.
+        self._dir_stats = None
+        self._file_stats = None
 
     # ------------------------------------------------------------------
     # Plugin lifecycle
@@ -113,6 +169,8 @@ class SortAndGroupLayersPlugin:
         layer_menu = self._find_layer_menu()
         if layer_menu is None:
             return
+        # Kept so unload() need not search the main window again.
+        self.layer_menu = layer_menu
 
         # --- Sort Layers submenu ---
         self.sort_menu = QMenu("Sort Layers", self.iface.mainWindow())
@@ -203,7 +261,7 @@ class SortAndGroupLayersPlugin:
 
     def unload(self):
         """Remove the plugin menu entries and clean up."""
-        layer_menu = self._find_layer_menu()
+        layer_menu = self.layer_menu
         if layer_menu:
             for menu_action in (self.sort_menu_action, self.group_menu_action):
                 if menu_action:
@@ -213,13 +271,14 @@ class SortAndGroupLayersPlugin:
             if menu:
                 menu.deleteLater()
 
+        self.layer_menu = None
         self.sort_menu = None
         self.group_menu = None
         self.sort_menu_action = None
         self.group_menu_action = None
         self.actions.clear()
         self.original_order_nodes = None
-        self._saved_layers = None
+        self._file_paths.clear()
 
         try:
             QgsProject.instance().cleared.disconnect(self._clear_saved_order)
@@ -248,21 +307,22 @@ class SortAndGroupLayersPlugin:
     def _save_original_order(self):
         """Save the current layer tree order (once, before the first sort/group).
 
-        Stores both tree node copies (using direct layer references) and
-        a dict of all QgsMapLayer objects to prevent garbage collection.
+        Stores tree node copies that use direct layer references.  The
+        project owns the layers themselves, so no separate copy of the
+        layer registry is kept.
         """
         if self.original_order_nodes is not None:
             return
         root = QgsProject.instance().layerTreeRoot()
-        self.original_order_nodes = [
-            self._copy_node(child) for child in root.children()
-        ]
-        self._saved_layers = dict(QgsProject.instance().mapLayers())
+        # Restore always resolves references, so the flag is not needed.
+        self.original_order_nodes, _unresolved = self._copy_nodes(
+            root.children(),
+        )
 
     def _clear_saved_order(self):
         """Clear the saved original order (called when the project changes)."""
         self.original_order_nodes = None
-        self._saved_layers = None
+        self._file_paths.clear()
 
     # ------------------------------------------------------------------
     # Tree node copy helpers
@@ -274,40 +334,87 @@ class SortAndGroupLayersPlugin:
 
         Using the QgsLayerTreeLayer(QgsMapLayer) constructor keeps a live
         reference to the layer object, which is more robust than clone()
-        that only stores the layer ID string.
+        that only stores the layer ID string.  A node whose layer is not
+        loaded falls back to clone().
+
+        Returns:
+            tuple: (new node, True if it refers to its layer by ID only
+            and needs ``resolveReferences()``).
         """
         layer = original.layer()
         if layer is None:
-            return original.clone()
+            return original.clone(), True
         node = QgsLayerTreeLayer(layer)
         node.setItemVisibilityChecked(original.itemVisibilityChecked())
         node.setExpanded(original.isExpanded())
-        return node
+        return node, False
+
+    @staticmethod
+    def _copy_group_shell(group):
+        """Create an empty QgsLayerTreeGroup with *group*'s name and state."""
+        new_group = QgsLayerTreeGroup(group.name())
+        new_group.setItemVisibilityChecked(group.itemVisibilityChecked())
+        new_group.setExpanded(group.isExpanded())
+        if group.isMutuallyExclusive():
+            new_group.setIsMutuallyExclusive(True)
+        return new_group
 
     @staticmethod
     def _copy_node(node):
-        """Recursively copy a tree node, using direct layer references.
+        """Copy a tree node, using direct layer references.
 
         For QgsLayerTreeLayer nodes, creates a new node via the
         QgsLayerTreeLayer(QgsMapLayer) constructor so the layer
         reference is maintained directly rather than by ID lookup.
         For QgsLayerTreeGroup nodes, rebuilds the group and copies
-        all children recursively.
+        all descendants, walking nested groups with an explicit work
+        list instead of recursion.
+
+        Returns:
+            tuple: (copy, True if any layer node in it refers to its
+            layer by ID only and needs ``resolveReferences()``).
         """
+        cls = SortAndGroupLayersPlugin
         if isinstance(node, QgsLayerTreeLayer):
-            return SortAndGroupLayersPlugin._make_layer_node(node)
-        if isinstance(node, QgsLayerTreeGroup):
-            group = QgsLayerTreeGroup(node.name())
-            group.setItemVisibilityChecked(node.itemVisibilityChecked())
-            group.setExpanded(node.isExpanded())
-            if node.isMutuallyExclusive():
-                group.setIsMutuallyExclusive(True)
-            for child in node.children():
-                group.addChildNode(
-                    SortAndGroupLayersPlugin._copy_node(child)
-                )
-            return group
-        return node.clone()
+            return cls._make_layer_node(node)
+        if not isinstance(node, QgsLayerTreeGroup):
+            return node.clone(), False
+
+        unresolved = False
+        top = cls._copy_group_shell(node)
+        pending = [(node, top)]
+        while pending:
+            source, target = pending.pop()
+            copies = []
+            for child in source.children():
+                if isinstance(child, QgsLayerTreeLayer):
+                    copy, by_id = cls._make_layer_node(child)
+                    unresolved = unresolved or by_id
+                elif isinstance(child, QgsLayerTreeGroup):
+                    copy = cls._copy_group_shell(child)
+                    pending.append((child, copy))
+                else:
+                    copy = child.clone()
+                copies.append(copy)
+            if copies:
+                target.insertChildNodes(0, copies)
+        return top, unresolved
+
+    @staticmethod
+    def _copy_nodes(nodes):
+        """Copy each of *nodes* with :meth:`_copy_node`.
+
+        Returns:
+            tuple: (list of copies, True if any of them needs
+            ``resolveReferences()``).
+        """
+        copies = []
+        unresolved = False
+        for node in nodes:
+            copy, by_id = SortAndGroupLayersPlugin._copy_node(node)
+            copies.append(copy)
+            unresolved = unresolved or by_id
+        return copies, unresolved
 
     # ------------------------------------------------------------------
     # Tree manipulation helpers
@@ -315,19 +422,26 @@ class SortAndGroupLayersPlugin:
 
     @staticmethod
     def _flatten_layer_nodes(parent):
-        """Recursively collect all QgsLayerTreeLayer nodes from *parent*."""
+        """Collect all QgsLayerTreeLayer nodes below *parent*, in tree order.
+
+        Walks nested groups with a stack of child iterators rather than
+        recursion, so deeply nested trees cannot hit the recursion limit.
+        """
         nodes = []
-        for child in parent.children():
-            if isinstance(child, QgsLayerTreeLayer):
-                nodes.append(child)
-            elif isinstance(child, QgsLayerTreeGroup):
-                nodes.extend(
-                    SortAndGroupLayersPlugin._flatten_layer_nodes(child)
-                )
+        add_node = nodes.append
+        stack = [iter(parent.children())]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, QgsLayerTreeLayer):
+                    add_node(child)
+                elif isinstance(child, QgsLayerTreeGroup):
+                    stack.append(iter(child.children()))
+                    break
+            else:
+                stack.pop()
         return nodes
 
-    @staticmethod
-    def _rebuild_tree(root, new_children):
+    def _rebuild_tree(self, root, new_children, resolve_references=False):
         """Replace all children of *root* with *new_children*.
 
         Uses a safe two-phase approach:
@@ -337,6 +451,18 @@ class SortAndGroupLayersPlugin:
           Phase 2 -- Remove the original children with the
                      layer-tree-registry bridge disabled, then re-add
                      any layers that were inadvertently de-registered.
+
+        Painting of the Layers panel is suspended for the duration, so
+        the view redraws once at the end instead of after each phase.
+        Model signals are left alone; the view must still see every
+        change to stay consistent with the tree.
+
+        Args:
+            root:               The layer tree root.
+            new_children:       Nodes that replace the current children.
+            resolve_references: Resolve layer references afterwards;
+                                needed when some of *new_children* refer
+                                to their layer by ID only.
         """
         project = QgsProject.instance()
         bridge = project.layerTreeRegistryBridge()
@@ -348,29 +474,38 @@ class SortAndGroupLayersPlugin:
 
         original_count = len(root.children())
 
-        # Phase 1: append new children at the end of the tree.
-        # No nodes are removed yet, so every layer still has its
-        # original tree node and the bridge has nothing to react to.
-        for child in new_children:
-            root.addChildNode(child)
-
-        # Phase 2: remove the *original* children (they are the first
-        # ``original_count`` items, since new children were appended).
-        bridge.setEnabled(False)
+        view = self.iface.layerTreeView()
+        if view is not None:
+            view.setUpdatesEnabled(False)
         try:
-            for _ in range(original_count):
-                root.removeChildNode(root.children()[0])
-
-            # Safety net: re-register any layers that were lost.
-            for lid, layer in saved_layers.items():
-                if project.mapLayer(lid) is None:
-                    project.addMapLayer(layer, False)
+            # Phase 1: append new children at the end of the tree, in one
+            # batch so the layer tree model sees a single insertion.
+            # No nodes are removed yet, so every layer still has its
+            # original tree node and the bridge has nothing to react to.
+            root.insertChildNodes(-1, list(new_children))
+
+            # Phase 2: remove the *original* children (they are the first
+            # ``original_count`` items, since new children were appended),
+            # again as one batch.
+            bridge.setEnabled(False)
+            try:
+                root.removeChildren(0, original_count)
+
+                # Safety net: re-register any layers that were lost.
+                for lid, layer in saved_layers.items():
+                    if project.mapLayer(lid) is None:
+                        project.addMapLayer(layer, False)
+            finally:
+                bridge.setEnabled(True)
+
+            # Nodes built by _make_layer_node() already hold their layer.
+            # Only clone() fallbacks store a bare layer ID, so resolve
+            # references (a walk of the whole tree) just in that case.
+            if resolve_references:
+                root.resolveReferences(project)
         finally:
-            bridge.setEnabled(True)
-
-        # Resolve layer references on all (new) tree nodes so that
-        # node.layer() returns the correct QgsMapLayer object.
-        root.resolveReferences(project)
+            if view is not None:
+                view.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # Sorting engine
@@ -380,7 +515,9 @@ class SortAndGroupLayersPlugin:
         """Reorder top-level layer tree nodes using *key_func*.
 
         If the tree already contains groups, sorting is applied *within*
-        each group and the groups themselves are also reordered.
+        each group and the groups themselves are also reordered.  When
+        the tree is already in sorted order it is left untouched, so the
+        Layers panel is not rebuilt and no original order is saved.
 
         Args:
             key_func: Callable accepting a QgsLayerTreeNode and returning
@@ -392,70 +529,192 @@ class SortAndGroupLayersPlugin:
         if not children:
             return
 
-        self._save_original_order()
+        stat_keyed = key_func in (self._key_file_date, self._key_file_size)
+        key_func = self._memoize_key(key_func)
 
         has_groups = any(
             isinstance(c, QgsLayerTreeGroup) for c in children
         )
 
-        if has_groups:
-            new_nodes = self._sort_with_groups(children, key_func, reverse)
+        if _SCANDIR_HAS_STAT:
+            self._dir_stats = {}
+        try:
+            if stat_keyed:
+                self._prefetch_stats(root)
+            if has_groups:
+                plan = self._sort_with_groups(children, key_func, reverse)
+            else:
+                plan = [
+                    (child, None)
+                    for child in sorted(
+                        children, key=key_func, reverse=reverse,
+                    )
+                ]
+        finally:
+            self._dir_stats = None
+            self._file_stats = None
+
+        if self._is_current_order(children, plan):
+            return
+
+        self._save_original_order()
+        new_nodes = []
+        resolve_references = False
+        for node, kids in plan:
+            if kids is None:
+                copy, unresolved = self._copy_node(node)
+            else:
+                copy = self._copy_group_shell(node)
+                kid_copies, unresolved = self._copy_nodes(kids)
+                if kid_copies:
+                    copy.insertChildNodes(0, kid_copies)
+            new_nodes.append(copy)
+            resolve_references = resolve_references or unresolved
+
+        self._rebuild_tree(root, new_nodes, resolve_references)
+
+    @staticmethod
+    def _is_current_order(children, plan):
+        """Return True if *plan* keeps every node where it already is.
+
+        Args:
+            children: The root's current top-level nodes.
+            plan:     Sorted ``(node, kids)`` pairs, as returned by
+                      :meth:`_sort_with_groups`.
+        """
+        for child, (node, kids) in zip(children, plan):
+            if node is not child:
+                return False
+            if kids is not None and any(
+                kid is not current
+                for kid, current in zip(kids, node.children())
+            ):
+                return False
+        return True
+
+    def _prefetch_stats(self, root):
+        """Stat every layer file below *root* concurrently.
+
+        Date and size sorts are bound by ``stat`` latency, which on
+        network drives is a round trip per file.  Issuing the calls from
+        a thread pool overlaps those round trips; the results are kept
+        for :meth:`_stat_file` until the sort finishes.  On Windows the
+        per-folder directory scans are prefetched instead.
+        """
+        paths = set()
+        for node in self._flatten_layer_nodes(root):
+            layer = node.layer()
+            if layer is not None:
+                file_path = self._get_file_path(layer)
+                if file_path:
+                    paths.add(file_path)
+
+        dir_stats = self._dir_stats
+        if dir_stats is not None:
+            jobs = list({
+                os.path.dirname(os.path.normcase(path)) for path in paths
+            })
+            func = self._scan_dir_stats
         else:
-            new_nodes = [
-                self._copy_node(child)
-                for child in sorted(
-                    children, key=key_func, reverse=reverse,
-                )
-            ]
+            jobs = list(paths)
+            func = self._stat_file
+        if len(jobs) < _STAT_PREFETCH_MIN_JOBS:
+            return
+
+        workers = min(_STAT_PREFETCH_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = dict(zip(jobs, pool.map(func, jobs)))
+
+        if dir_stats is not None:
+            dir_stats.update(results)
+        else:
+            self._file_stats = results
+
+    @staticmethod
+    def _memoize_key(key_func):
+        """Wrap *key_func* so each layer's key is computed once per sort.
+
+        Keys such as file date and size cost a URI decode plus a ``stat``
+        per call, and a layer can be keyed more than once (as a group's
+        first child, or when it appears in several groups).  The cache is
+        keyed by layer ID and lives only for one sort, so renamed layers
+        and modified files are always re-read on the next sort.
+        """
+        cache = {}
+
+        def cached_key(node):
+            if not isinstance(node, QgsLayerTreeLayer):
+                return key_func(node)
+            layer_id = node.layerId()
+            if layer_id not in cache:
+                cache[layer_id] = key_func(node)
+            return cache[layer_id]
 
-        self._rebuild_tree(root, new_nodes)
+        return cached_key
 
     def _sort_with_groups(self, children, key_func, reverse):
         """Sort within each group and sort the top-level items.
 
-        Returns a list of new top-level nodes in sorted order.
+        Nothing is copied here; the caller builds the new nodes once it
+        knows the order has changed.
+
+        Returns:
+            A list of ``(node, kids)`` pairs in sorted top-level order,
+            where *kids* is a group's children in sorted order, or None
+            for a top-level layer.
         """
         keyed_nodes = []
 
         for child in children:
             if isinstance(child, QgsLayerTreeGroup):
-                # Sort the group's children by key_func.
-                sorted_kids = sorted(
-                    child.children(), key=key_func, reverse=reverse,
-                )
-
-                # Build a new group with copies in sorted order.
-                new_group = QgsLayerTreeGroup(child.name())
-                new_group.setItemVisibilityChecked(
-                    child.itemVisibilityChecked()
-                )
-                new_group.setExpanded(child.isExpanded())
-                if child.isMutuallyExclusive():
-                    new_group.setIsMutuallyExclusive(True)
-                for kid in sorted_kids:
-                    new_group.addChildNode(self._copy_node(kid))
+                # Sort the group's children by key_func, computing each
+                # key exactly once (decorate-sort-undecorate).
+                keyed_kids = [(key_func(kid), kid) for kid in child.children()]
+                keyed_kids.sort(key=itemgetter(0), reverse=reverse)
 
                 # Group sort key: derived from its first child.
-                if sorted_kids:
-                    group_key = key_func(sorted_kids[0])
+                if keyed_kids:
+                    group_key = keyed_kids[0][0]
                 else:
                     group_key = key_func(child)
 
-                keyed_nodes.append((group_key, new_group))
+                kids = [kid for _key, kid in keyed_kids]
+                keyed_nodes.append((group_key, child, kids))
             else:
-                keyed_nodes.append(
-                    (key_func(child), self._copy_node(child))
-                )
+                keyed_nodes.append((key_func(child), child, None))
 
-        keyed_nodes.sort(key=lambda x: x[0], reverse=reverse)
-        return [node for _, node in keyed_nodes]
+        keyed_nodes.sort(key=itemgetter(0), reverse=reverse)
+        return [(node, kids) for _key, node, kids in keyed_nodes]
 
     # ------------------------------------------------------------------
     # File path extraction
     # ------------------------------------------------------------------
 
+    def _get_file_path(self, layer):
+        """Return the on-disk file path of *layer*'s data source.
+
+        Layers from providers that never read local files (web services,
+        databases, memory layers) return immediately.  Other results are
+        cached by ``(providerType, source)``, so each distinct source is
+        decoded once per project rather than once per sort key call.  A
+        layer whose data source changes simply misses the cache.
+
+        Returns:
+            The file path string, or empty string if the source is not
+            file-based.
+        """
+        provider_type = layer.providerType()
+        if provider_type in _NON_FILE_PROVIDERS:
+            return ""
+        key = (provider_type, layer.source())
+        file_path = self._file_paths.get(key)
+        if file_path is None:
+            file_path = self._decode_file_path(*key)
+            self._file_paths[key] = file_path
+        return file_path
+
     @staticmethod
-    def _get_file_path(layer):
+    def _decode_file_path(provider_type, source):
         """Extract the on-disk file path from a layer's data source.
 
         Uses QgsProviderRegistry.decodeUri() for robust extraction that
@@ -473,7 +732,7 @@ class SortAndGroupLayersPlugin:
         # --- Attempt 1: decodeUri (most reliable) ---
         try:
             uri_parts = QgsProviderRegistry.instance().decodeUri(
-                layer.providerType(), layer.source()
+                provider_type, source
             )
             # Check every key that providers commonly use for file paths.
             for key in ("path", "dbname", "filename", "url"):
@@ -481,13 +740,9 @@ class SortAndGroupLayersPlugin:
                 if not val:
                     continue
                 # Strip file:// prefix if present (delimitedtext provider).
-                if val.startswith("file://"):
-                    val = val[7:]
-                    # On Windows file:// URLs may look like file:///C:/...
-                    if len(val) > 2 and val[0] == "/" and val[2] == ":":
-                        val = val[1:]
+                val = _FILE_URL_PREFIX_RE.sub("", val, count=1)
                 # Ignore pure URLs (WMS/WFS).
-                if val.startswith(("http://", "https://")):
+                if val.startswith(_WEB_URL_PREFIXES):
                     continue
                 if val:
                     return val
@@ -495,11 +750,9 @@ class SortAndGroupLayersPlugin:
             pass
 
         # --- Attempt 2: parse the raw source string ---
-        source = layer.source()
-
         # GeoPackage / OGR style: "path|layername=..."
         candidate = source.split("|")[0].strip()
-        if candidate and not candidate.startswith(("http://", "https://")):
+        if candidate and not candidate.startswith(_WEB_URL_PREFIXES):
             return candidate
 
         # SpatiaLite style: "dbname='path' table=..."
@@ -513,44 +766,92 @@ class SortAndGroupLayersPlugin:
 
         return ""
 
+    def _stat_file(self, file_path):
+        """Return ``os.stat()`` of *file_path* if it is a regular file.
+
+        One ``stat`` call answers both "is it a file?" and the date/size
+        query, instead of ``isfile()`` followed by ``getmtime()`` or
+        ``getsize()``.  During a sort on Windows the result comes from a
+        single ``os.scandir()`` of the file's folder, shared by every
+        layer stored there; elsewhere it may already have been fetched
+        by :meth:`_prefetch_stats`.
+
+        Returns:
+            os.stat_result, or None for empty paths, missing files and
+            directories.
+        """
+        if not file_path:
+            return None
+        file_stats = self._file_stats
+        if file_stats is not None and file_path in file_stats:
+            return file_stats[file_path]
+        st = None
+        dir_stats = self._dir_stats
+        if dir_stats is not None:
+            folder, name = os.path.split(os.path.normcase(file_path))
+            entries = dir_stats.get(folder)
+            if entries is None:
+                entries = self._scan_dir_stats(folder)
+                dir_stats[folder] = entries
+            st = entries.get(name)
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except (OSError, ValueError):
+                return None
+        return st if stat.S_ISREG(st.st_mode) else None
+
+    @staticmethod
+    def _scan_dir_stats(folder):
+        """Return ``{normcased name: stat_result}`` for entries in *folder*.
+
+        Symlinks are left out so that :meth:`_stat_file` stats their
+        target itself.  An unreadable folder yields an empty dict.
+        """
+        stats = {}
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if not entry.is_symlink():
+                        stats[os.path.normcase(entry.name)] = entry.stat()
+        except OSError:
+            pass
+        return stats
+
     # ------------------------------------------------------------------
     # Sort key helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _key_file_path(node):
+    def _key_file_path(self, node):
         """File path, lower-cased.  Falls back to source URI for
         non-file layers so they still sort consistently."""
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
-            fp = SortAndGroupLayersPlugin._get_file_path(node.layer())
-            return (fp or node.layer().source()).lower()
-        if isinstance(node, QgsLayerTreeGroup):
-            return node.name().lower()
-        return ""
+        if isinstance(node, QgsLayerTreeLayer):
+            layer = node.layer()
+            if layer is None:
+                return ""
+            fp = self._get_file_path(layer)
+            return (fp or layer.source()).lower()
+        return node.name().lower()
 
     @staticmethod
     def _key_alphabetical(node):
         """Display name, lower-cased."""
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
-            return node.layer().name().lower()
-        if isinstance(node, QgsLayerTreeGroup):
-            return node.name().lower()
-        return ""
+        if isinstance(node, QgsLayerTreeLayer):
+            layer = node.layer()
+            return layer.name().lower() if layer is not None else ""
+        return node.name().lower()
 
-    @classmethod
-    def _key_file_date(cls, node):
+    def _key_file_date(self, node):
         """File modification timestamp (float seconds since epoch).
 
         Non-file layers (WMS, PostGIS, memory layers, etc.) and groups
         return 0.0 so they sort to the end in descending mode.
         """
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
-            file_path = cls._get_file_path(node.layer())
-            if file_path and os.path.isfile(file_path):
-                try:
-                    return os.path.getmtime(file_path)
-                except OSError:
-                    pass
+        layer = node.layer() if isinstance(node, QgsLayerTreeLayer) else None
+        if layer is not None:
+            st = self._stat_file(self._get_file_path(layer))
+            if st is not None:
+                return st.st_mtime
         return 0.0
 
     @staticmethod
@@ -559,8 +860,10 @@ class SortAndGroupLayersPlugin:
 
         A secondary alphabetical sort is applied within each type.
         """
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
+        if isinstance(node, QgsLayerTreeLayer):
             layer = node.layer()
+            if layer is None:
+                return (999, "")
             if isinstance(layer, QgsVectorLayer):
                 return (
                     _GEOMETRY_SORT_ORDER.get(layer.geometryType(), 99),
@@ -569,9 +872,7 @@ class SortAndGroupLayersPlugin:
             if isinstance(layer, QgsRasterLayer):
                 return (90, layer.name().lower())
             return (95, layer.name().lower())
-        if isinstance(node, QgsLayerTreeGroup):
-            return (100, node.name().lower())
-        return (999, "")
+        return (100, node.name().lower())
 
     @staticmethod
     def _key_feature_count(node):
@@ -580,27 +881,24 @@ class SortAndGroupLayersPlugin:
         Raster layers return -1 and groups return -2 so they sort to the
         end in descending mode.
         """
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
+        if isinstance(node, QgsLayerTreeLayer):
             layer = node.layer()
             if isinstance(layer, QgsVectorLayer):
                 return layer.featureCount()
-            return -1
+            return -1 if layer is not None else -2
         return -2
 
-    @classmethod
-    def _key_file_size(cls, node):
+    def _key_file_size(self, node):
         """File size in bytes (int).
 
         Non-file layers and groups return -1 so they sort to the end in
         descending mode.
         """
-        if isinstance(node, QgsLayerTreeLayer) and node.layer():
-            file_path = cls._get_file_path(node.layer())
-            if file_path and os.path.isfile(file_path):
-                try:
-                    return os.path.getsize(file_path)
-                except OSError:
-                    pass
+        layer = node.layer() if isinstance(node, QgsLayerTreeLayer) else None
+        if layer is not None:
+            st = self._stat_file(self._get_file_path(layer))
+            if st is not None:
+                return st.st_size
         return -1
 
     # ------------------------------------------------------------------
@@ -650,33 +948,31 @@ class SortAndGroupLayersPlugin:
         self._save_original_order()
 
         # Categorise each layer node.
-        categories = {}  # {(sort_order, display_name): [nodes]}
+        categories = defaultdict(list)   # {category: [nodes]}
 
         for node in all_layers:
             layer = node.layer()
-            if layer is None:
-                key = (99, "Other Layers")
-            elif isinstance(layer, QgsVectorLayer):
+            if isinstance(layer, QgsVectorLayer):
                 geom = layer.geometryType()
-                order = _GEOMETRY_SORT_ORDER.get(geom, 99)
-                name = _GEOMETRY_GROUP_NAMES.get(geom, "Other Layers")
-                key = (order, name)
+                if geom not in _GEOMETRY_GROUP_NAMES:
+                    geom = _CATEGORY_OTHER
+                categories[geom].append(node)
             elif isinstance(layer, QgsRasterLayer):
-                key = (90, "Raster Layers")
+                categories[_CATEGORY_RASTER].append(node)
             else:
-                key = (99, "Other Layers")
-
-            categories.setdefault(key, []).append(node)
+                categories[_CATEGORY_OTHER].append(node)
 
         # Build the new tree with one group per category.
         new_children = []
-        for (order, name) in sorted(categories):
-            group = QgsLayerTreeGroup(name)
-            for node in categories[(order, name)]:
-                group.addChildNode(self._copy_node(node))
+        resolve_references = False
+        for category in sorted(categories, key=_CATEGORY_SORT_ORDER.get):
+            group = QgsLayerTreeGroup(_CATEGORY_GROUP_NAMES[category])
+            copies, unresolved = self._copy_nodes(categories[category])
+            group.insertChildNodes(0, copies)
             new_children.append(group)
+            resolve_references = resolve_references or unresolved
 
-        self._rebuild_tree(root, new_children)
+        self._rebuild_tree(root, new_children, resolve_references)
 
     def group_by_folder(self):
         """Group all layers by their source folder path.
@@ -695,25 +991,28 @@ class SortAndGroupLayersPlugin:
         self._save_original_order()
 
         # Categorise by source folder.
-        folders = {}   # {folder_path: [(sort_key, node)]}
+        folders = defaultdict(list)   # {folder_path: [(sort_key, node)]}
         other = []
 
+        # Local aliases for the per-layer loop.
+        split_path = os.path.split
+        get_file_path = self._get_file_path
+        add_other = other.append
+
         for node in all_layers:
             layer = node.layer()
             if layer is None:
-                other.append(node)
+                add_other(node)
                 continue
-            file_path = self._get_file_path(layer)
             # Accept any path that has a directory component.  We do
             # NOT require os.path.isfile() because the path may use a
             # provider-specific format that Python cannot stat, yet it
             # still represents a valid on-disk location.
-            if file_path and os.path.dirname(file_path):
-                folder = os.path.dirname(file_path)
-                filename = os.path.basename(file_path).lower()
-                folders.setdefault(folder, []).append((filename, node))
+            folder, filename = split_path(get_file_path(layer))
+            if folder:
+                folders[folder].append((filename.lower(), node))
             else:
-                other.append(node)
+                add_other(node)
 
         # Generate short, unique display names for each folder.
         display_names = self._unique_folder_names(list(folders.keys()))
@@ -721,64 +1020,67 @@ class SortAndGroupLayersPlugin:
         # Build the new tree, sorted alphabetically by display name.
         # Within each group, layers are sorted by filename.
         new_children = []
+        resolve_references = False
         for folder_path in sorted(
             folders, key=lambda fp: display_names[fp].lower(),
         ):
             group = QgsLayerTreeGroup(display_names[folder_path])
-            for _filename, node in sorted(
-                folders[folder_path], key=lambda x: x[0],
-            ):
-                group.addChildNode(self._copy_node(node))
+            copies, unresolved = self._copy_nodes(
+                node for _filename, node in sorted(
+                    folders[folder_path], key=itemgetter(0),
+                )
+            )
+            group.insertChildNodes(0, copies)
             new_children.append(group)
+            resolve_references = resolve_references or unresolved
 
         if other:
             group = QgsLayerTreeGroup("Other Sources")
-            for node in other:
-                group.addChildNode(self._copy_node(node))
+            copies, unresolved = self._copy_nodes(other)
+            group.insertChildNodes(0, copies)
             new_children.append(group)
+            resolve_references = resolve_references or unresolved
 
-        self._rebuild_tree(root, new_children)
+        self._rebuild_tree(root, new_children, resolve_references)
 
     @staticmethod
     def _unique_folder_names(folder_paths):
         """Return a dict mapping each folder path to a short unique name.
 
-        Uses the directory basename; if duplicates exist, prepends the
-        parent directory for disambiguation.  Falls back to the full
-        normalised path if still ambiguous.
+        Each folder is named by the shortest trailing run of its path
+        components that no other folder shares: the basename when that
+        is unique, otherwise ``parent/base``, ``grandparent/parent/base``
+        and so on, up to the full normalised path.
+
+        The trailing components of all folders are counted in one trie
+        built over the reversed paths; each node holds
+        ``[count, children]``.
         """
         if not folder_paths:
             return {}
 
-        norm = {fp: os.path.normpath(fp) for fp in folder_paths}
-
-        # Group by basename.
-        base_groups = {}
+        trie = [0, {}]
+        parts = {}   # {fp: (norm, reversed components)}
         for fp in folder_paths:
-            base = os.path.basename(norm[fp]) or norm[fp]
-            base_groups.setdefault(base, []).append(fp)
+            norm = os.path.normpath(fp)
+            components = norm.split(os.sep)[::-1]
+            parts[fp] = (norm, components)
+            node = trie
+            for component in components:
+                node = node[1].setdefault(component, [0, {}])
+                node[0] += 1
 
         result = {}
-        for base, paths in base_groups.items():
-            if len(paths) == 1:
-                result[paths[0]] = base
-            else:
-                # Try parent/base to disambiguate.
-                seen = {}
-                for fp in paths:
-                    parent = os.path.basename(os.path.dirname(norm[fp]))
-                    combo = (
-                        os.path.join(parent, base) if parent else norm[fp]
-                    )
-                    seen.setdefault(combo, []).append(fp)
-
-                for combo, sub_paths in seen.items():
-                    if len(sub_paths) == 1:
-                        result[sub_paths[0]] = combo
-                    else:
-                        # Still ambiguous -- use full path.
-                        for fp in sub_paths:
-                            result[fp] = norm[fp]
+        for fp, (norm, components) in parts.items():
+            node = trie
+            depth = 0
+            for depth, component in enumerate(components, start=1):
+                node = node[1][component]
+                if node[0] == 1:
+                    break
+            name = os.sep.join(reversed(components[:depth]))
+            # A bare root ("/") splits into empty components only.
+            result[fp] = name if name.strip(os.sep) else norm
 
         return result
 
@@ -797,19 +1099,15 @@ class SortAndGroupLayersPlugin:
             )
             return
 
-        project = QgsProject.instance()
-        root = project.layerTreeRoot()
-
-        # Re-register any layers that were lost since the snapshot.
-        if self._saved_layers:
-            for lid, layer in self._saved_layers.items():
-                if project.mapLayer(lid) is None:
-                    project.addMapLayer(layer, False)
+        root = QgsProject.instance().layerTreeRoot()
 
-        # Copy the saved nodes (so the snapshot can be used again).
-        copies = [self._copy_node(node) for node in self.original_order_nodes]
-        self._rebuild_tree(root, copies)
+        # The snapshot is discarded after a restore, so its nodes are
+        # moved into the tree as they are instead of being copied.  Any
+        # layer they point at may have been removed and re-added since
+        # the snapshot, so have _rebuild_tree() resolve references.
+        self._rebuild_tree(
+            root, self.original_order_nodes, resolve_references=True,
+        )
 
         # Clear saved order after a successful restore.
         self.original_order_nodes = None
-        self._saved_layers = None